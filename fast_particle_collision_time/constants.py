@@ -2,6 +2,15 @@
 Constants used across the codebase.
 """
 
+__all__ = [
+    "ELECTRON_CHARGE",
+    "COULOMB_LOG",
+    "PERMITTIVITY_OF_FREE_SPACE",
+    "ELECTRON_MASS",
+    "PROTON_MASS",
+    "ALPHA_ION_MASS",
+]
+
 # Electron charge in Coulombs
 ELECTRON_CHARGE = 1.60217662e-19
 # Coulomb logarithm (dimensionless)
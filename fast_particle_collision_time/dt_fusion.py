@@ -4,39 +4,65 @@ reaction rate.
 """
 import numpy as np
 
+# Parameters of the Bosch-Hale fit for the DT reaction
+_GAMOV_CONSTANT = 34.382  # in sqrt(kev)
+_MRC2 = 1124656  # in keV
+_CONST_1 = 1.17302e-9
+_CONST_2 = 1.51361e-2
+_CONST_3 = 7.51886e-2
+_CONST_4 = 4.60643e-3
+_CONST_5 = 1.35000e-2
+_CONST_6 = -1.06750e-4
+_CONST_7 = 1.36600e-5
+_XI_NUMERATOR = 0.25 * _GAMOV_CONSTANT**2
+
 def reactivity(temp_ions):
     """
     This function computes the DT reactivity. Using this paper:
     H.-S. Bosch and G.M. Hale 1992 Nucl. Fusion 32 611
 
     Input:
-      - temp_ions: temperature of the ions in keV
+      - temp_ions: temperature of the ions in keV, either a float or
+        a NumPy array of temperatures
 
     Output:
-      - reactivity: DT reactivity in cm^3/s
+      - reactivity: DT reactivity in cm^3/s, with the same shape as temp_ions
     """
+    if getattr(temp_ions, "ndim", 0) == 0:
+        # The in-place evaluation below only pays off for arrays
+        numerator = temp_ions * (_CONST_2 + temp_ions * (_CONST_4 + temp_ions * _CONST_6))
+        denominator = 1 + temp_ions * (_CONST_3 + temp_ions * (_CONST_5 + temp_ions * _CONST_7))
+        theta = temp_ions / (1 - numerator / denominator)
+        xi_greek = (_XI_NUMERATOR / theta)**(1 / 3)
+        return _CONST_1 * theta * np.sqrt(xi_greek / (_MRC2 * temp_ions**3)) \
+               * np.exp(-3 * xi_greek)
 
-    gamov_constant = 34.382  # in sqrt(kev)
-    mrc2 = 1124656  # in keV
-    const_1 = 1.17302e-9
-    const_2 = 1.51361e-2
-    const_3 = 7.51886e-2
-    const_4 = 4.60643e-3
-    const_5 = 1.35000e-2
-    const_6 = -1.06750e-4
-    const_7 = 1.36600e-5
-
-    # Calculate theta
-    denominator = -temp_ions * (const_2 +
-                                temp_ions * (const_4 +
-                                             temp_ions * const_6))
-    denominator /= 1 + temp_ions * (const_3 +
-                                    temp_ions * (const_5 +
-                                                 temp_ions * const_7))
+    # Calculate theta, with both polynomials in Horner form. The intermediate
+    # results are computed in place to avoid allocating a new array per operation.
+    temp_ions = np.asarray(temp_ions, dtype=float)
+    numerator = temp_ions * _CONST_6
+    numerator += _CONST_4
+    numerator *= temp_ions
+    numerator += _CONST_2
+    numerator *= temp_ions
+    denominator = temp_ions * _CONST_7
+    denominator += _CONST_5
+    denominator *= temp_ions
+    denominator += _CONST_3
+    denominator *= temp_ions
     denominator += 1
-    theta = temp_ions / denominator
-    xi_greek = (0.25 * gamov_constant**2 / theta)**(1/3)
-    sigma_v = const_1 * theta * np.sqrt(xi_greek / (mrc2 * temp_ions**3))
-    sigma_v *= np.exp(-3 * xi_greek)
-    return sigma_v
+    numerator /= denominator
+    np.subtract(1, numerator, out=numerator)
+    theta = np.divide(temp_ions, numerator, out=numerator)
+    xi_greek = np.divide(_XI_NUMERATOR, theta, out=denominator)
+    np.cbrt(xi_greek, out=xi_greek)
 
+    sigma_v = temp_ions**3
+    sigma_v *= _MRC2
+    np.divide(xi_greek, sigma_v, out=sigma_v)
+    np.sqrt(sigma_v, out=sigma_v)
+    sigma_v *= theta
+    sigma_v *= _CONST_1
+    xi_greek *= -3
+    sigma_v *= np.exp(xi_greek, out=xi_greek)
+    return sigma_v
@@ -0,0 +1,32 @@
+"""
+This module contains a Numba-compiled version of the DT reactivity in the
+dt_fusion module, for evaluation over large temperature grids.
+
+reactivity is a NumPy ufunc using Numba's parallel target, so the whole
+calculation is fused into a single loop over the input with no intermediate
+arrays. The number of threads is set by the NUMBA_NUM_THREADS environment
+variable.
+
+The results are checked against dt_fusion.reactivity in the tests.
+"""
+
+import math
+from numba import vectorize
+from fast_particle_collision_time.dt_fusion import (
+    _CONST_1, _CONST_2, _CONST_3, _CONST_4, _CONST_5, _CONST_6, _CONST_7, _MRC2, _XI_NUMERATOR
+)
+
+@vectorize(['float64(float64)'], target='parallel', fastmath=True, cache=True)
+def reactivity(temp_ions):
+    """
+    This function computes the DT reactivity. Using this paper:
+    H.-S. Bosch and G.M. Hale 1992 Nucl. Fusion 32 611
+
+    See dt_fusion.reactivity for a description of the input and output.
+    """
+    numerator = temp_ions * (_CONST_2 + temp_ions * (_CONST_4 + temp_ions * _CONST_6))
+    denominator = 1 + temp_ions * (_CONST_3 + temp_ions * (_CONST_5 + temp_ions * _CONST_7))
+    theta = temp_ions / (1 - numerator / denominator)
+    xi_greek = (_XI_NUMERATOR / theta)**(1 / 3)
+    return _CONST_1 * theta * math.sqrt(xi_greek / (_MRC2 * temp_ions**3)) \
+           * math.exp(-3 * xi_greek)
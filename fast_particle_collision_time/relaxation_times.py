@@ -6,13 +6,60 @@ Please note that we follow the equations 2.14.1 and 2.14.2 in the book:
 Wesson, J. Tokamaks, Vol. 149. Oxford University Press, 2011. 
 """
 
+import functools
+import math
 import numpy as np
 import scipy.special
 from fast_particle_collision_time import constants
 
+# Constant part of A_D, e^4 lnLambda / (2 pi epsilon_0^2)
+_AD_PREFACTOR = constants.ELECTRON_CHARGE**4 * constants.COULOMB_LOG / \
+                (2 * np.pi * constants.PERMITTIVITY_OF_FREE_SPACE**2)
+_SQRT2_INV = 1 / np.sqrt(2)
+_SQRT_PI = np.sqrt(np.pi)
+# Below this argument Psi is evaluated from its Taylor series
+_PSI_SERIES_THRESHOLD = 0.1
+
+def _a_d_array(background_density, test_charge_state, background_charge_state, test_mass):
+    """
+    Calculates the A_D function (see page 63 of Wesson, 2011). Any of the
+    arguments may be NumPy arrays.
+
+    Parameters
+    ----------
+    background_density : float
+        The background density of the background species
+        in m^(-3)
+    test_charge_state : float
+        The charge state of the test particle (dimensionless)
+    background_charge_state : float
+        The charge state of the background species (dimensionless)
+    test_mass : float
+        The mass of the test particle in kg
+
+    Returns
+    -------
+    float
+        The value of A_D in m^3 s^(-4)
+    """
+    charge_product = test_charge_state * background_charge_state
+    return _AD_PREFACTOR * background_density * charge_product * charge_product \
+           / (test_mass * test_mass)
+
+@functools.lru_cache(maxsize=128)
 def _a_d(background_density, test_charge_state, background_charge_state, test_mass):
     """
-    Calculates the A_D function (see page 63 of Wesson, 2011).
+    Memoised version of _a_d_array for scalar arguments, as A_D is typically
+    recomputed with the same species parameters many times. Raises a TypeError
+    for array arguments, which are unhashable; callers then fall back to _a_d_array.
+    """
+    return _a_d_array(background_density, test_charge_state, background_charge_state,
+                      test_mass)
+
+def compute_a_d(background_density, test_charge_state, background_charge_state, test_mass):
+    """
+    Calculates the A_D function (see page 63 of Wesson, 2011), memoised for scalar
+    arguments. It can be passed to slowing_down_time_precomp.
 
     Parameters
     ----------
@@ -31,15 +78,29 @@ def _a_d(background_density, test_charge_state, background_charge_state, test_ma
     float
         The value of A_D in m^3 s^(-4)
     """
-    return background_density * constants.ELECTRON_CHARGE**4 * test_charge_state**2 \
-           * background_charge_state**2 * constants.COULOMB_LOG / \
-           (2 * np.pi * constants.PERMITTIVITY_OF_FREE_SPACE**2 * test_mass**2)
+    try:
+        return _a_d(background_density, test_charge_state, background_charge_state, test_mass)
+    except TypeError:
+        # Unhashable (array) arguments cannot be memoised. A TypeError raised by
+        # the calculation itself is raised again by this uncached call.
+        return _a_d_array(background_density, test_charge_state, background_charge_state,
+                          test_mass)
 
 def _phi(x):
     """
     Calculates the Phi function on page 62 of Wesson, 2011. Note that it is
     equivalent to the error function.
+
+    A full-precision error function is required here: Psi is computed from
+    Phi - x * Phi' which cancels for small x, so the ~1e-7 absolute error of
+    the usual polynomial approximations (e.g. Abramowitz & Stegun 7.1.26)
+    becomes an O(1) relative error in Psi for slow test particles.
+
+    Float scalars are passed to math.erf, which avoids the ufunc dispatch overhead
+    of scipy.special.erf.
     """
+    if isinstance(x, float):
+        return math.erf(x)
     return scipy.special.erf(x)
 
 def _phi_prime(x):
@@ -47,13 +108,59 @@ def _phi_prime(x):
     Calculates the derivative of the Phi function on page 62 of Wesson, 2011. Note that it is
     equivalent to the derivative of the error function.
     """
-    return 2 * np.exp(-x**2) / np.sqrt(np.pi)
+    return 2 * np.exp(-x**2) / _SQRT_PI
+
+def _psi_series(x):
+    """
+    Calculates the Taylor series of the Psi function about x = 0. Truncating after
+    the x^11 term gives a relative error below 1e-15 for |x| < 0.1.
+    """
+    # Horner form of 1 - 3x^2/5 + 3x^4/14 - x^6/18 + x^8/88 - x^10/520, updated
+    # in place so that array arguments do not allocate a temporary per term
+    x2 = x * x
+    series = x2 * (-1 / 520)
+    series += 1 / 88
+    series *= x2
+    series += -1 / 18
+    series *= x2
+    series += 3 / 14
+    series *= x2
+    series += -3 / 5
+    series *= x2
+    series += 1
+    series *= x
+    series *= 2 / (3 * _SQRT_PI)
+    return series
+
+def _phi_psi(x):
+    """
+    Calculates both the Phi and Psi functions on pages 62 and 63 of Wesson, 2011.
+    The error function is evaluated only once and shared between the two results.
+
+    For |x| < _PSI_SERIES_THRESHOLD, Phi - x * Phi' suffers from cancellation
+    (and is 0 / 0 at x = 0), so Psi is taken from its Taylor series instead.
+    """
+    if isinstance(x, float):
+        phi = _phi(x)
+        if abs(x) < _PSI_SERIES_THRESHOLD:
+            return phi, _psi_series(x)
+        return phi, (phi - x * _phi_prime(x)) / (2 * x**2)
+    if np.ndim(x) == 0:
+        return _phi_psi(float(x))
+    phi = _phi(x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        psi = (phi - x * _phi_prime(x)) / (2 * x**2)
+    # Only evaluate the series where it is needed
+    small = np.abs(x) < _PSI_SERIES_THRESHOLD
+    if small.any():
+        psi[small] = _psi_series(x[small])
+    return phi, psi
 
 def _psi(x):
     """
     Calculates the Psi function on page 63 of Wesson, 2011.
     """
-    return (_phi(x) - x * _phi_prime(x)) / (2 * x**2)
+    return _phi_psi(x)[1]
 
 def slowing_down_time(test_speed, background_thermal_speed, test_mass, background_mass,
                       background_density, test_charge_state, background_charge_state):
@@ -62,7 +169,7 @@ def slowing_down_time(test_speed, background_thermal_speed, test_mass, backgroun
 
     Parameters
     ----------
-    test_speed : float
+    test_speed : float or numpy.ndarray
         The speed of the test particle in m s^(-1)
     background_thermal_speed : float
         The thermal speed of the background species in m s^(-1)
@@ -80,13 +187,41 @@ def slowing_down_time(test_speed, background_thermal_speed, test_mass, backgroun
 
     Returns
     -------
-    float
-        The value of the slowing down time in s
+    float or numpy.ndarray
+        The value of the slowing down time in s, with the same shape as test_speed
+    """
+    a_d = compute_a_d(background_density, test_charge_state, background_charge_state, test_mass)
+    return slowing_down_time_precomp(test_speed, background_thermal_speed, test_mass,
+                                     background_mass, a_d)
+
+def slowing_down_time_precomp(test_speed, background_thermal_speed, test_mass, background_mass,
+                              a_d):
+    """
+    Calculates the slowing down time (see page Eq. 2.14.1 of Wesson, 2011) using a
+    precomputed value of A_D from compute_a_d. This avoids recomputing A_D when
+    the species parameters are fixed, e.g. when sweeping over test speeds.
+
+    Parameters
+    ----------
+    test_speed : float or numpy.ndarray
+        The speed of the test particle in m s^(-1)
+    background_thermal_speed : float
+        The thermal speed of the background species in m s^(-1)
+    test_mass : float
+        The mass of the test particle in kg
+    background_mass : float
+        The mass of the background species in kg
+    a_d : float
+        The value of A_D in m^3 s^(-4)
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The value of the slowing down time in s, with the same shape as test_speed
     """
+    u = test_speed * _SQRT2_INV / background_thermal_speed
     return 2 * background_thermal_speed**2 * test_speed / \
-           ((1 + test_mass / background_mass) * \
-            _a_d(background_density, test_charge_state, background_charge_state, test_mass) \
-            * _psi(test_speed / (np.sqrt(2) * background_thermal_speed)))
+           ((1 + test_mass / background_mass) * a_d * _psi(u))
 
 def deflection_time(test_speed, background_thermal_speed, test_mass,
                     background_density, test_charge_state, background_charge_state):
@@ -95,7 +230,7 @@ def deflection_time(test_speed, background_thermal_speed, test_mass,
 
     Parameters
     ----------
-    test_speed : float
+    test_speed : float or numpy.ndarray
         The speed of the test particle in m s^(-1)
     background_thermal_speed : float
         The thermal speed of the background species in m s^(-1)
@@ -113,10 +248,10 @@ def deflection_time(test_speed, background_thermal_speed, test_mass,
 
     Returns
     -------
-    float
-        The value of the deflection time in s
+    float or numpy.ndarray
+        The value of the deflection time in s, with the same shape as test_speed
     """
-    return test_speed**3 / \
-           (_a_d(background_density, test_charge_state, background_charge_state, test_mass) * \
-            (_phi(test_speed / (np.sqrt(2) * background_thermal_speed)) - \
-             _psi(test_speed / (np.sqrt(2) * background_thermal_speed))))
+    a_d = compute_a_d(background_density, test_charge_state, background_charge_state, test_mass)
+    u = test_speed * _SQRT2_INV / background_thermal_speed
+    phi, psi = _phi_psi(u)
+    return test_speed**3 / (a_d * (phi - psi))
@@ -0,0 +1,88 @@
+"""
+This module contains GPU versions of the slowing down and deflection times in the
+relaxation_times module, for very large sweeps over test speeds.
+
+Each function evaluates Phi, Psi and the relaxation time in a single fused CuPy
+elementwise kernel, using CUDA's double precision erf. A_D is computed once on
+the host. The test speeds may be a CuPy or NumPy array, and a CuPy array is
+returned.
+
+Using this module requires CuPy and a CUDA device.
+"""
+
+import cupy as cp
+from fast_particle_collision_time import relaxation_times
+from fast_particle_collision_time.relaxation_times import (
+    _PSI_SERIES_THRESHOLD, _SQRT2_INV, _SQRT_PI
+)
+
+_PREAMBLE = f"""
+__device__ double psi_from_phi(double x, double phi) {{
+    double x2 = x * x;
+    if (fabs(x) < {_PSI_SERIES_THRESHOLD:.17g}) {{
+        // Same series as relaxation_times._psi_series
+        return 2 * x / (3 * {_SQRT_PI:.17g}) *
+               (1 + x2 * (-3.0 / 5 + x2 * (3.0 / 14 + x2 * (-1.0 / 18
+                + x2 * (1.0 / 88 - x2 / 520)))));
+    }}
+    return (phi - x * 2 * exp(-x2) / {_SQRT_PI:.17g}) / (2 * x2);
+}}
+"""
+
+_slowing_down_time_kernel = cp.ElementwiseKernel(
+    "float64 test_speed, float64 background_thermal_speed, float64 test_mass, "
+    "float64 background_mass, float64 a_d",
+    "float64 tau",
+    f"""
+    double u = test_speed * {_SQRT2_INV:.17g} / background_thermal_speed;
+    tau = 2 * background_thermal_speed * background_thermal_speed * test_speed /
+          ((1 + test_mass / background_mass) * a_d * psi_from_phi(u, erf(u)));
+    """,
+    "fast_particle_collision_time_slowing_down_time",
+    preamble=_PREAMBLE,
+)
+
+_deflection_time_kernel = cp.ElementwiseKernel(
+    "float64 test_speed, float64 background_thermal_speed, float64 a_d",
+    "float64 tau",
+    f"""
+    double u = test_speed * {_SQRT2_INV:.17g} / background_thermal_speed;
+    double phi = erf(u);
+    tau = test_speed * test_speed * test_speed / (a_d * (phi - psi_from_phi(u, phi)));
+    """,
+    "fast_particle_collision_time_deflection_time",
+    preamble=_PREAMBLE,
+)
+
+def slowing_down_time(test_speed, background_thermal_speed, test_mass, background_mass,
+                      background_density, test_charge_state, background_charge_state):
+    """
+    Calculates the slowing down time (see page Eq. 2.14.1 of Wesson, 2011) on the GPU.
+    See relaxation_times.slowing_down_time for a description of the arguments.
+
+    Returns
+    -------
+    cupy.ndarray
+        The value of the slowing down time in s, with the same shape as test_speed
+    """
+    a_d = relaxation_times.compute_a_d(background_density, test_charge_state,
+                                       background_charge_state, test_mass)
+    return _slowing_down_time_kernel(cp.asarray(test_speed, dtype=cp.float64),
+                                     background_thermal_speed, test_mass, background_mass,
+                                     a_d)
+
+def deflection_time(test_speed, background_thermal_speed, test_mass,
+                    background_density, test_charge_state, background_charge_state):
+    """
+    Calculates the deflection time (see page Eq. 2.14.2 of Wesson, 2011) on the GPU.
+    See relaxation_times.deflection_time for a description of the arguments.
+
+    Returns
+    -------
+    cupy.ndarray
+        The value of the deflection time in s, with the same shape as test_speed
+    """
+    a_d = relaxation_times.compute_a_d(background_density, test_charge_state,
+                                       background_charge_state, test_mass)
+    return _deflection_time_kernel(cp.asarray(test_speed, dtype=cp.float64),
+                                   background_thermal_speed, a_d)
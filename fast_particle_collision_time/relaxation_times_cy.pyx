@@ -0,0 +1,99 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+This module contains Cython-compiled batch versions of the slowing down and
+deflection times in the relaxation_times module, for use in long-running
+simulations where Numba's JIT latency or LLVM dependency is unwanted.
+
+The batch functions loop over a contiguous array of test speeds in C, without
+holding the GIL. Cython is declared as a build requirement in pyproject.toml,
+but a failed compilation is not fatal, so callers should be prepared for this
+module to be missing.
+"""
+
+import numpy as np
+from libc.math cimport erf, exp, fabs, sqrt, M_PI
+from fast_particle_collision_time.relaxation_times import _AD_PREFACTOR, _PSI_SERIES_THRESHOLD
+
+cdef double _SQRT2_INV = 1 / sqrt(2)
+cdef double _SQRT_PI = sqrt(M_PI)
+cdef double _AD_PREFACTOR_C = _AD_PREFACTOR
+cdef double _PSI_SERIES_THRESHOLD_C = _PSI_SERIES_THRESHOLD
+
+cdef inline double _a_d(double background_density, double test_charge_state,
+                        double background_charge_state, double test_mass) noexcept nogil:
+    """
+    Calculates the A_D function (see page 63 of Wesson, 2011).
+    """
+    cdef double charge_product = test_charge_state * background_charge_state
+    return _AD_PREFACTOR_C * background_density * charge_product * charge_product \
+           / (test_mass * test_mass)
+
+cdef inline double _psi(double x, double phi) noexcept nogil:
+    """
+    Calculates the Psi function on page 63 of Wesson, 2011, given Phi(x).
+    """
+    cdef double x2 = x * x
+    if fabs(x) < _PSI_SERIES_THRESHOLD_C:
+        # Same series as relaxation_times._psi_series
+        return 2 * x / (3 * _SQRT_PI) * \
+               (1 + x2 * (-3.0 / 5 + x2 * (3.0 / 14 + x2 * (-1.0 / 18
+                + x2 * (1.0 / 88 - x2 / 520)))))
+    return (phi - x * 2 * exp(-x2) / _SQRT_PI) / (2 * x2)
+
+cpdef slowing_down_time_batch(const double[::1] test_speed, double background_thermal_speed,
+                              double test_mass, double background_mass,
+                              double background_density, double test_charge_state,
+                              double background_charge_state):
+    """
+    Calculates the slowing down time (see page Eq. 2.14.1 of Wesson, 2011) for a
+    contiguous float64 array of test speeds. See relaxation_times.slowing_down_time
+    for a description of the arguments.
+
+    Returns
+    -------
+    numpy.ndarray
+        The value of the slowing down time in s for each test speed
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = test_speed.shape[0]
+    cdef double u
+    cdef double a_d = _a_d(background_density, test_charge_state, background_charge_state,
+                           test_mass)
+    cdef double prefactor = 2 * background_thermal_speed**2 / \
+                            ((1 + test_mass / background_mass) * a_d)
+    result = np.empty(n)
+    cdef double[::1] result_view = result
+
+    with nogil:
+        for i in range(n):
+            u = test_speed[i] * _SQRT2_INV / background_thermal_speed
+            result_view[i] = prefactor * test_speed[i] / _psi(u, erf(u))
+    return result
+
+cpdef deflection_time_batch(const double[::1] test_speed, double background_thermal_speed,
+                            double test_mass, double background_density,
+                            double test_charge_state, double background_charge_state):
+    """
+    Calculates the deflection time (see page Eq. 2.14.2 of Wesson, 2011) for a
+    contiguous float64 array of test speeds. See relaxation_times.deflection_time
+    for a description of the arguments.
+
+    Returns
+    -------
+    numpy.ndarray
+        The value of the deflection time in s for each test speed
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t n = test_speed.shape[0]
+    cdef double u, phi
+    cdef double a_d = _a_d(background_density, test_charge_state, background_charge_state,
+                           test_mass)
+    result = np.empty(n)
+    cdef double[::1] result_view = result
+
+    with nogil:
+        for i in range(n):
+            u = test_speed[i] * _SQRT2_INV / background_thermal_speed
+            phi = erf(u)
+            result_view[i] = test_speed[i]**3 / (a_d * (phi - _psi(u, phi)))
+    return result
@@ -0,0 +1,97 @@
+"""
+This module contains Numba-compiled versions of the slowing down and deflection
+times in the relaxation_times module, for use in large parameter sweeps and
+Monte-Carlo codes.
+
+The private functions are scalar kernels compiled with numba.njit, so they can be
+called from other jitted code. slowing_down_time and deflection_time are NumPy
+ufuncs built from these kernels, so they broadcast over arrays of any argument.
+They use Numba's parallel target, which splits the elements across threads; the
+number of threads is set by the NUMBA_NUM_THREADS environment variable.
+
+Importing this module requires numba, which the rest of the package does not.
+"""
+
+import math
+from numba import njit, vectorize
+from fast_particle_collision_time import constants
+from fast_particle_collision_time.relaxation_times import (
+    _PSI_SERIES_THRESHOLD, _SQRT2_INV, _SQRT_PI
+)
+
+# Numba freezes module-level globals as compile-time constants
+_ELECTRON_CHARGE = constants.ELECTRON_CHARGE
+_COULOMB_LOG = constants.COULOMB_LOG
+_PERMITTIVITY_OF_FREE_SPACE = constants.PERMITTIVITY_OF_FREE_SPACE
+
+@njit(cache=True, fastmath=True)
+def _a_d(background_density, test_charge_state, background_charge_state, test_mass):
+    """
+    Calculates the A_D function (see page 63 of Wesson, 2011).
+    """
+    return background_density * _ELECTRON_CHARGE**4 * test_charge_state**2 \
+           * background_charge_state**2 * _COULOMB_LOG / \
+           (2 * math.pi * _PERMITTIVITY_OF_FREE_SPACE**2 * test_mass**2)
+
+@njit(cache=True, fastmath=True)
+def _phi_psi(x):
+    """
+    Calculates both the Phi and Psi functions on pages 62 and 63 of Wesson, 2011.
+    """
+    phi = math.erf(x)
+    if abs(x) < _PSI_SERIES_THRESHOLD:
+        # Same series as relaxation_times._psi_series
+        x2 = x * x
+        psi = 2 * x / (3 * _SQRT_PI) * \
+              (1 + x2 * (-3 / 5 + x2 * (3 / 14 + x2 * (-1 / 18 + x2 * (1 / 88 - x2 / 520)))))
+    else:
+        psi = (phi - x * 2 * math.exp(-x**2) / _SQRT_PI) / (2 * x**2)
+    return phi, psi
+
+@njit(cache=True, fastmath=True)
+def _slowing_down_time(test_speed, background_thermal_speed, test_mass, background_mass,
+                       background_density, test_charge_state, background_charge_state):
+    """
+    Calculates the slowing down time (see page Eq. 2.14.1 of Wesson, 2011)
+    for scalar arguments.
+    """
+    a_d = _a_d(background_density, test_charge_state, background_charge_state, test_mass)
+    u = test_speed * _SQRT2_INV / background_thermal_speed
+    psi = _phi_psi(u)[1]
+    return 2 * background_thermal_speed**2 * test_speed / \
+           ((1 + test_mass / background_mass) * a_d * psi)
+
+@njit(cache=True, fastmath=True)
+def _deflection_time(test_speed, background_thermal_speed, test_mass,
+                     background_density, test_charge_state, background_charge_state):
+    """
+    Calculates the deflection time (see page Eq. 2.14.2 of Wesson, 2011)
+    for scalar arguments.
+    """
+    a_d = _a_d(background_density, test_charge_state, background_charge_state, test_mass)
+    u = test_speed * _SQRT2_INV / background_thermal_speed
+    phi, psi = _phi_psi(u)
+    return test_speed**3 / (a_d * (phi - psi))
+
+@vectorize(['float64(float64, float64, float64, float64, float64, float64, float64)'],
+           target='parallel', fastmath=True, cache=True)
+def slowing_down_time(test_speed, background_thermal_speed, test_mass, background_mass,
+                      background_density, test_charge_state, background_charge_state):
+    """
+    Calculates the slowing down time (see page Eq. 2.14.1 of Wesson, 2011).
+    See relaxation_times.slowing_down_time for a description of the arguments.
+    """
+    return _slowing_down_time(test_speed, background_thermal_speed, test_mass,
+                              background_mass, background_density, test_charge_state,
+                              background_charge_state)
+
+@vectorize(['float64(float64, float64, float64, float64, float64, float64)'],
+           target='parallel', fastmath=True, cache=True)
+def deflection_time(test_speed, background_thermal_speed, test_mass,
+                    background_density, test_charge_state, background_charge_state):
+    """
+    Calculates the deflection time (see page Eq. 2.14.2 of Wesson, 2011).
+    See relaxation_times.deflection_time for a description of the arguments.
+    """
+    return _deflection_time(test_speed, background_thermal_speed, test_mass,
+                            background_density, test_charge_state, background_charge_state)
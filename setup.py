@@ -2,10 +2,25 @@
 This is the setup script for the codebase.
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
+
+# The Cython extension is optional. pip installs Cython into the build
+# environment (see pyproject.toml); a failed compilation does not stop the
+# installation.
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    EXT_MODULES = []
+else:
+    EXT_MODULES = cythonize([
+        Extension('fast_particle_collision_time.relaxation_times_cy',
+                  ['fast_particle_collision_time/relaxation_times_cy.pyx'],
+                  optional=True),
+    ])
 
 setup(
     name='fast_particle_collision_time',
     version='0.1.0',
     packages=find_packages(),
+    ext_modules=EXT_MODULES,
 )
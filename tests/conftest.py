@@ -0,0 +1,23 @@
+"""
+Shared fixtures for the tests.
+"""
+
+import numpy as np
+import pytest
+from fast_particle_collision_time import constants
+
+@pytest.fixture
+def alpha_electron_case():
+    """
+    Alpha particles with speeds up to 1.3e7 m/s in an electron background with a
+    temperature of 10 keV and density of 10^20 m^-3.
+
+    Returns the array of alpha speeds, followed by the remaining arguments of
+    slowing_down_time and of deflection_time as tuples.
+    """
+    electron_thermal_speed = np.sqrt(10e3 * constants.ELECTRON_CHARGE / constants.ELECTRON_MASS)
+    alpha_speeds = np.linspace(1e5, 1.3e7, 100)
+    slowing_down_args = (electron_thermal_speed, constants.ALPHA_ION_MASS,
+                         constants.ELECTRON_MASS, 1e20, 2, 1)
+    deflection_args = (electron_thermal_speed, constants.ALPHA_ION_MASS, 1e20, 2, 1)
+    return alpha_speeds, slowing_down_args, deflection_args
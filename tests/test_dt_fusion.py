@@ -0,0 +1,28 @@
+"""
+Tests for the dt_fusion module.
+"""
+
+import numpy as np
+import pytest
+from fast_particle_collision_time import dt_fusion
+
+# DT reactivities in cm^3/s from Table VIII of Bosch and Hale (1992)
+BOSCH_HALE_TABLE = {
+    1.0: 6.857e-21,
+    2.0: 2.977e-19,
+    10.0: 1.136e-16,
+    20.0: 4.330e-16,
+}
+
+@pytest.mark.parametrize("temp_ions, expected_value", BOSCH_HALE_TABLE.items())
+def test_reactivity_bosch_hale_table(temp_ions, expected_value):
+    """Test the DT reactivity against the values tabulated by Bosch and Hale."""
+    assert dt_fusion.reactivity(temp_ions) == pytest.approx(expected_value, rel=1e-3)
+
+def test_reactivity_accepts_arrays():
+    """Test that an array of temperatures gives the same result as scalar calls."""
+    temps = np.array(list(BOSCH_HALE_TABLE))
+    sigma_v = dt_fusion.reactivity(temps)
+    assert sigma_v.shape == temps.shape
+    for i, temp_ions in enumerate(temps):
+        assert sigma_v[i] == pytest.approx(dt_fusion.reactivity(temp_ions))
@@ -0,0 +1,17 @@
+"""
+Tests for the dt_fusion_numba module.
+"""
+
+import numpy as np
+import pytest
+from fast_particle_collision_time import dt_fusion
+
+dt_fusion_numba = pytest.importorskip("fast_particle_collision_time.dt_fusion_numba")
+
+def test_numba_reactivity_matches_reference():
+    """Test that the Numba ufunc agrees with the reference NumPy implementation."""
+    temps = np.linspace(0.5, 100, 200)
+    np.testing.assert_allclose(dt_fusion_numba.reactivity(temps),
+                               dt_fusion.reactivity(temps), rtol=1e-9)
+    assert dt_fusion_numba.reactivity(10.0) == pytest.approx(dt_fusion.reactivity(10.0),
+                                                             rel=1e-9)
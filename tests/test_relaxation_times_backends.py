@@ -0,0 +1,64 @@
+"""
+Tests for the compiled backends of the relaxation_times module. Each backend is
+skipped if its optional dependency is not available.
+"""
+
+import numpy as np
+import pytest
+from fast_particle_collision_time import relaxation_times
+
+# Module name, slowing down and deflection function names, and relative tolerance
+# against the reference implementation (Numba is compiled with fastmath)
+BACKENDS = {
+    "numba": ("relaxation_times_numba", "slowing_down_time", "deflection_time", 1e-9),
+    "cython": ("relaxation_times_cy", "slowing_down_time_batch", "deflection_time_batch",
+               1e-12),
+    "cupy": ("relaxation_times_cupy", "slowing_down_time", "deflection_time", 1e-12),
+}
+
+def _import_backend(name):
+    """
+    Imports the backend module, skipping the test if it is not available.
+    """
+    if name == "cupy":
+        cp = pytest.importorskip("cupy")
+        try:
+            has_gpu = cp.cuda.runtime.getDeviceCount() > 0
+        except cp.cuda.runtime.CUDARuntimeError:
+            has_gpu = False
+        if not has_gpu:
+            pytest.skip("no CUDA device available")
+    return pytest.importorskip(f"fast_particle_collision_time.{BACKENDS[name][0]}")
+
+def _to_numpy(array):
+    """
+    Copies a CuPy array back to the host; NumPy arrays are returned unchanged.
+    """
+    return array.get() if hasattr(array, "get") else array
+
+@pytest.mark.parametrize("name", BACKENDS)
+def test_backend_matches_reference(name, alpha_electron_case):
+    """
+    Test that each backend agrees with the reference NumPy implementation
+    for an alpha particle in a 10 keV, 10^20 m^-3 electron background.
+    """
+    module = _import_backend(name)
+    _, slowing_down_name, deflection_name, rtol = BACKENDS[name]
+    alpha_speeds, args, deflection_args = alpha_electron_case
+
+    np.testing.assert_allclose(
+        _to_numpy(getattr(module, slowing_down_name)(alpha_speeds, *args)),
+        relaxation_times.slowing_down_time(alpha_speeds, *args), rtol=rtol)
+    np.testing.assert_allclose(
+        _to_numpy(getattr(module, deflection_name)(alpha_speeds, *deflection_args)),
+        relaxation_times.deflection_time(alpha_speeds, *deflection_args), rtol=rtol)
+
+def test_numba_scalar(alpha_electron_case):
+    """
+    Test that the Numba ufuncs return a scalar for scalar arguments.
+    """
+    relaxation_times_numba = _import_backend("numba")
+    alpha_speeds, args, _ = alpha_electron_case
+
+    assert relaxation_times_numba.slowing_down_time(alpha_speeds[-1], *args) == \
+        pytest.approx(relaxation_times.slowing_down_time(alpha_speeds[-1], *args), rel=1e-9)
@@ -2,8 +2,8 @@
 Tests for the relaxation_times module.
 """
 
+import math
 import os
-import matplotlib.pyplot as plt
 import numpy as np
 import pytest
 from fast_particle_collision_time import constants, relaxation_times
@@ -14,6 +14,9 @@ def test_slowing_down_time_alpha_vs_electrons():
     The electrons are assumed to have a temperature of 10 keV and density of 10^20 m^-3.
     We compare the result of the relaxation_times.slowing_down_time to the approximation
     given in Eq. 5.4.3 for speeds up to 3.5 MeV.
+
+    If the MAKE_PLOTS environment variable is set, the results are also plotted
+    to tests/test_plots for visual inspection.
     """
     # Parameters
     electron_temperature_ev = 10e3  # 10 keV electron temperature
@@ -45,21 +48,17 @@ def test_slowing_down_time_alpha_vs_electrons():
         return 3 * np.sqrt(2 * np.pi * t_e**3) / \
             (np.sqrt(m_e) * m_alpha * a_d(n_e, z_e, z_alpha, m_alpha))
 
-    # Values for the slowing down time
-    tau_slowing_down_times = []
-    tau_slowing_down_approx = []
-
-    # Calculate the slowing down time for each alpha speed
-    for v_alpha in alpha_speeds:
-        tau_s = relaxation_times.slowing_down_time(v_alpha, electron_thermal_speed, alpha_mass,
-                                                   electron_mass, electron_density,
-                                                   alpha_charge_state, electron_charge_state)
-        tau_approx = slowing_down_time_approx(electron_temperature_j, electron_density,
-                                              electron_mass, alpha_mass,
-                                              electron_charge_state, alpha_charge_state)
-
-        tau_slowing_down_times.append(tau_s)
-        tau_slowing_down_approx.append(tau_approx)
+    # Calculate the slowing down time for all alpha speeds at once
+    tau_slowing_down_times = relaxation_times.slowing_down_time(alpha_speeds,
+                                                                electron_thermal_speed,
+                                                                alpha_mass, electron_mass,
+                                                                electron_density,
+                                                                alpha_charge_state,
+                                                                electron_charge_state)
+    tau_approx = slowing_down_time_approx(electron_temperature_j, electron_density,
+                                          electron_mass, alpha_mass,
+                                          electron_charge_state, alpha_charge_state)
+    tau_slowing_down_approx = np.full_like(alpha_speeds, tau_approx)
 
     # Check the specific case where energy is 3.5 MeV
     tau_s_3_5_mev = tau_slowing_down_times[-1]
@@ -70,6 +69,14 @@ def test_slowing_down_time_alpha_vs_electrons():
         f"Slowing down time at 3.5 MeV differs: tau_s = {tau_s_3_5_mev}," \
         f" tau_approx = {tau_approx_3_5_mev}"
 
+    if not os.environ.get("MAKE_PLOTS"):
+        return
+
+    # Import matplotlib only when plotting, as it dominates the test runtime
+    import matplotlib  # pylint: disable=import-outside-toplevel
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
     # Plot the results for visual inspection
     fig, ax = plt.subplots()
     ax.plot(alpha_energies_mev, tau_slowing_down_times,
@@ -89,5 +96,67 @@ def test_slowing_down_time_alpha_vs_electrons():
     fig.savefig(os.path.join(test_plots_dir, "slowing_down_time_alpha_vs_electrons.png"),
                 dpi=300, bbox_inches="tight")
 
+def test_relaxation_times_accept_arrays(alpha_electron_case):
+    """
+    Test that passing an array of test speeds gives the same result as
+    evaluating the slowing down and deflection times one speed at a time.
+    """
+    alpha_speeds, args, deflection_args = alpha_electron_case
+
+    tau_s = relaxation_times.slowing_down_time(alpha_speeds, *args)
+    tau_d = relaxation_times.deflection_time(alpha_speeds, *deflection_args)
+
+    assert tau_s.shape == alpha_speeds.shape
+    assert tau_d.shape == alpha_speeds.shape
+    for i, v_alpha in enumerate(alpha_speeds):
+        assert tau_s[i] == pytest.approx(relaxation_times.slowing_down_time(v_alpha, *args))
+        assert tau_d[i] == pytest.approx(relaxation_times.deflection_time(v_alpha,
+                                                                          *deflection_args))
+
+def test_slowing_down_time_precomp(alpha_electron_case):
+    """
+    Test that slowing_down_time_precomp with A_D from compute_a_d matches
+    slowing_down_time.
+    """
+    alpha_speeds, args, _ = alpha_electron_case
+    a_d = relaxation_times.compute_a_d(args[3], args[4], args[5], args[1])
+
+    tau_s = relaxation_times.slowing_down_time(alpha_speeds, *args)
+    tau_s_precomp = relaxation_times.slowing_down_time_precomp(alpha_speeds, *args[:3], a_d)
+
+    np.testing.assert_allclose(tau_s_precomp, tau_s, rtol=1e-12)
+
+def test_psi_small_argument():
+    """
+    Test the Psi function against its power series, which converges quickly for
+    small arguments, where the closed form suffers from cancellation.
+    """
+    # pylint: disable=protected-access
+    def psi_series(x, n_terms=40):
+        return sum((-1)**(n + 1) * 2 * n * x**(2 * n - 1) / (math.factorial(n) * (2 * n + 1))
+                   for n in range(1, n_terms)) / math.sqrt(math.pi)
+
+    x_values = [1e-6, 1e-4, 1e-2, 0.0999, 0.1, 0.3, 1.0]
+    expected = [psi_series(x) for x in x_values]
+
+    for x, psi in zip(x_values, expected):
+        assert relaxation_times._psi(x) == pytest.approx(psi, rel=1e-13)
+    np.testing.assert_allclose(relaxation_times._psi(np.array(x_values)), expected, rtol=1e-13)
+    assert relaxation_times._psi(0.0) == 0.0
+
+def test_a_d_array_arguments():
+    """
+    Test that A_D accepts an array of background densities, which cannot be
+    memoised, and agrees with the scalar (memoised) result.
+    """
+    densities = np.array([1e19, 1e20, 1e21])
+    a_d = relaxation_times.compute_a_d(densities, 2, 1, constants.ALPHA_ION_MASS)
+
+    assert a_d.shape == densities.shape
+    for i, density in enumerate(densities):
+        assert a_d[i] == pytest.approx(relaxation_times.compute_a_d(density, 2, 1,
+                                                                    constants.ALPHA_ION_MASS))
+
 if __name__ == "__main__":
+    os.environ.setdefault("MAKE_PLOTS", "1")
     test_slowing_down_time_alpha_vs_electrons()